@@ -25,7 +25,7 @@ from algobot.interface.palettes import red_palette, dark_palette, green_palette,
 
 from PyQt5 import uic
 from PyQt5.QtWidgets import QMainWindow, QApplication, QMessageBox, QTableWidgetItem, QFileDialog
-from PyQt5.QtCore import QThreadPool, QRunnable
+from PyQt5.QtCore import QThreadPool, QRunnable, QTimer
 from PyQt5.QtGui import QIcon, QTextCursor
 from pyqtgraph import mkPen, PlotWidget, InfiniteLine
 
@@ -78,6 +78,24 @@ class Interface(QMainWindow):
 
         self.graphUpdateSeconds = 1
         self.graphUpdateSchedule: List[float or None] = [None, None]  # LIVE, SIM
+        self.latestValueDicts: Dict[int, dict] = {LIVE: {}, SIMULATION: {}}  # Merged statistics from bot deltas.
+
+        self.statisticsTimer = QTimer(self)  # Polls bot threads for statistics at a fixed rate; latest values win.
+        self.statisticsTimer.setInterval(100)
+        self.statisticsTimer.timeout.connect(self.update_bot_statistics)
+        self.statisticsTimer.start()
+
+    def update_bot_statistics(self):
+        """
+        Pulls accumulated statistics changes from running bot threads and applies them to the interface. Polling
+        at a fixed rate keeps the Qt event queue bounded no matter how fast the bots tick.
+        """
+        for caller in (LIVE, SIMULATION):
+            botWorker = self.threads.get(caller)
+            if botWorker:  # Also drain after the run flag clears, so the final tick's statistics still land.
+                valueDict, groupedDict = botWorker.get_pending_statistics()
+                if valueDict or groupedDict:
+                    self.update_interface_info(caller=caller, valueDict=valueDict, groupedDict=groupedDict)
 
     def inform_telegram(self, message):
         """
@@ -342,11 +360,11 @@ class Interface(QMainWindow):
         self.disable_interface(True, caller)
 
         worker = botThread.BotThread(gui=self, caller=caller, logger=self.logger)
+        self.threads[caller] = worker
         worker.signals.smallError.connect(self.create_popup)
         worker.signals.error.connect(self.end_crash_bot_and_create_popup)
         worker.signals.activity.connect(self.add_to_monitor)
         worker.signals.started.connect(self.initial_bot_ui_setup)
-        worker.signals.updated.connect(self.update_interface_info)
         worker.signals.progress.connect(self.download_progress_update)
         worker.signals.addTrade.connect(lambda trade: self.update_trades_table_and_activity_monitor(trade, caller))
         worker.signals.restore.connect(lambda: self.disable_interface(disable=False, caller=caller))
@@ -360,7 +378,7 @@ class Interface(QMainWindow):
         worker.signals.resume.connect(lambda: self.pause_or_resume_bot(LIVE))
         worker.signals.setCustomStopLoss.connect(self.set_custom_stop_loss)
         worker.signals.removeCustomStopLoss.connect(lambda: self.set_custom_stop_loss(LIVE, False))
-        self.threadPool.start(worker)
+        botThread.BOT_POOL.start(worker)
 
     def download_progress_update(self, value, message, caller):
         """
@@ -411,10 +429,15 @@ class Interface(QMainWindow):
         tempTrader = None
         elapsed = time.time()
 
+        botWorker = self.threads.get(caller)
+        if botWorker:
+            botWorker.runFlag.clear()  # Tell the bot thread to stop ticking.
+
         if caller == SIMULATION:
             self.simulationRunningLive = False
             if self.simulationTrader:
                 self.simulationTrader.dataView.downloadLoop = False
+                self.simulationTrader.dataView.stop_kline_socket()
 
                 if self.simulationLowerIntervalData:
                     self.simulationLowerIntervalData.downloadLoop = False
@@ -432,6 +455,7 @@ class Interface(QMainWindow):
             self.runningLive = False
             if self.trader:
                 self.trader.dataView.downloadLoop = False
+                self.trader.dataView.stop_kline_socket()
 
                 if self.lowerIntervalData:
                     self.lowerIntervalData.downloadLoop = False
@@ -468,6 +492,10 @@ class Interface(QMainWindow):
         """
         Function that force ends bot in the event that it crashes.
         """
+        botWorker = self.threads.get(caller)
+        if botWorker:
+            botWorker.runFlag.clear()  # Tell the bot thread to stop ticking.
+
         if caller == LIVE:
             self.runningLive = False
             if self.lowerIntervalData and not self.lowerIntervalData.downloadCompleted:
@@ -539,13 +567,16 @@ class Interface(QMainWindow):
 
     def update_interface_info(self, caller, valueDict: dict, groupedDict: dict):
         """
-        Updates interface elements based on caller.
+        Updates interface elements based on caller. The dictionaries received only contain values that changed
+        since the previous update, so they are merged into the cached full dictionary first.
         :param groupedDict: Dictionary with which to populate the statistics window.
         :param valueDict: Dictionary containing statistics.
         :param caller: Object that determines which object gets updated.
         """
+        currentValueDict = self.latestValueDicts[caller]
+        currentValueDict.update(valueDict)
         self.statistics.modify_tab(groupedDict, tabType=self.get_caller_string(caller))
-        self.update_main_interface_and_graphs(caller=caller, valueDict=valueDict)
+        self.update_main_interface_and_graphs(caller=caller, valueDict=currentValueDict)
         self.handle_position_buttons(caller=caller)
         self.handle_custom_stop_loss_buttons(caller=caller)
 
@@ -2,6 +2,22 @@ from typing import List, Tuple
 from algobot.helpers import get_data_from_parameter
 
 
+def get_parameter_values(data: List[dict], parameter: str) -> list:
+    """
+    Returns a flat list of values for the parameter from the data provided. Plain parameters use direct key
+    access, so the moving average loops below avoid a Python function call per element.
+    :param data: Data to get parameter values from.
+    :param parameter: Parameter from data dictionary with which to get values.
+    :return: List of parameter values.
+    """
+    if parameter == 'high/low':
+        return [(period['high'] + period['low']) / 2 for period in data]
+    elif parameter == 'open/close':
+        return [(period['open'] + period['close']) / 2 for period in data]
+    else:
+        return [period[parameter] for period in data]
+
+
 def get_wma(data: List[dict], prices: int, parameter: str, desc: bool = True) -> float:
     """
     Calculates the weighted moving average from data provided.
@@ -12,20 +28,15 @@ def get_wma(data: List[dict], prices: int, parameter: str, desc: bool = True) ->
     :param parameter: Parameter from data dictionary with which to get the weighted moving average.
     :return: Weighted moving average.
     """
+    values = get_parameter_values(data, parameter)
     if desc:
-        total = get_data_from_parameter(data=data[0], parameter=parameter) * prices
-        data = data[1:]
-
-        index = 0
-        for x in range(prices - 1, 0, -1):
-            total += x * get_data_from_parameter(data=data[index], parameter=parameter)
-            index += 1
+        total = values[0] * prices
+        for weight, value in zip(range(prices - 1, 0, -1), values[1:]):
+            total += weight * value
     else:
-        total = get_data_from_parameter(data=data[-1], parameter=parameter) * prices
-        data = data[:-1]
-
-        for index, data in enumerate(data, start=1):
-            total += index * get_data_from_parameter(data, parameter)
+        total = values[-1] * prices
+        for weight, value in enumerate(values[:-1], start=1):
+            total += weight * value
 
     divisor = prices * (prices + 1) / 2
     wma = total / divisor
@@ -40,7 +51,7 @@ def get_sma(data: List[dict], prices: int, parameter: str) -> float:
     :param parameter: Parameter from data dictionary with which to get the simple moving average.
     :return: Simple moving average.
     """
-    return sum([get_data_from_parameter(data=period, parameter=parameter) for period in data]) / prices
+    return sum(get_parameter_values(data, parameter)) / prices
 
 
 def get_ema(data: List[dict], prices: int, parameter: str, sma_prices: int, memo: dict = None, desc: bool = True) -> \
@@ -85,8 +96,7 @@ def get_ema(data: List[dict], prices: int, parameter: str, sma_prices: int, memo
             values = [[ema, data[sma_prices - 1]['date_utc']]]
             data = data[sma_prices:]
 
-        for period in data:
-            current_price = get_data_from_parameter(period, parameter=parameter)
+        for period, current_price in zip(data, get_parameter_values(data, parameter)):
             ema = current_price * multiplier + ema * (1 - multiplier)
             values.append([ema, period['date_utc']])
 
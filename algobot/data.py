@@ -3,11 +3,13 @@ import time
 import os
 
 from typing import List
+from threading import Lock
 from contextlib import closing
 from datetime import timedelta, timezone, datetime
 
 from binance.client import Client
 from binance.helpers import interval_to_milliseconds
+from binance.websockets import BinanceSocketManager
 
 from algobot.helpers import get_logger, ROOT_DIR, get_ups_and_downs
 from algobot.algorithms import get_sma, get_wma, get_ema
@@ -40,10 +42,16 @@ class Data:
         self.downloadCompleted = False  # Boolean to determine whether data download is completed or not.
         self.downloadLoop = True  # Boolean to determine whether data is being downloaded or not.
 
+        self.socketManager = None  # Websocket manager that pushes kline updates (if started).
+        self.socketConnectionKey = None  # Connection key of the kline socket stream.
+        self.socketUpdated = False  # Boolean for whether a kline has been pushed since the socket started.
+        self.socketLastUpdate = 0.0  # Monotonic time of the last websocket push, used to detect silent stalls.
+
         symbol = symbol.upper()
         self.validate_symbol(symbol)  # Validate symbol.
         self.symbol = symbol  # Symbol of data being used.
         self.data = []  # Total bot data.
+        self.dataLock = Lock()  # Guards run-time data against concurrent socket and bot thread mutations.
         self.ema_dict = {}  # Cached past EMA data for memoization.
         self.rsi_data = {}  # Cached past RSI data for memoization.
         self.current_values = {  # This dictionary will hold current data values.
@@ -311,6 +319,14 @@ class Data:
         """
         # This code below is taken from binance client and slightly refactored.
         self.downloadLoop = True
+
+        if self.data and self.data_is_updated():  # Local database cache is already current; skip the download.
+            if progress_callback:
+                progress_callback.emit(100, "Database data is up-to-date; no new data to download.", caller)
+            self.downloadLoop = False
+            self.downloadCompleted = True
+            return self.data
+
         output_data = []  # Initialize our list
         timeframe = interval_to_milliseconds(self.interval)
         start_ts = total_beginning_timestamp = self.get_latest_timestamp()
@@ -423,7 +439,11 @@ class Data:
                             }
             temp_data.append(current_dict)
 
-        self.data = temp_data + self.data
+        with self.dataLock:
+            if self.data:  # The websocket stream may have inserted some of these candles already; skip duplicates.
+                latestDate = self.data[0]['date_utc']
+                temp_data = [entry for entry in temp_data if entry['date_utc'] > latestDate]
+            self.data = temp_data + self.data
 
     def update_data(self, verbose=False):
         """
@@ -451,16 +471,86 @@ class Data:
         """
         Remove past data past data limit.
         """
-        if len(self.data) > self.dataLimit:  # Remove past data.
-            self.dump_to_table()
-            self.data = self.data[:self.dataLimit // 2]
+        with self.dataLock:
+            if len(self.data) > self.dataLimit:  # Remove past data.
+                self.dump_to_table()
+                self.data = self.data[:self.dataLimit // 2]
+
+    def start_kline_socket(self):
+        """
+        Starts a websocket kline stream that pushes candle updates into this data object. While the stream is
+        live, current values are served from pushed data and no REST polling is needed per tick.
+        """
+        if self.socketManager is not None:
+            return
+
+        self.socketManager = BinanceSocketManager(self.binanceClient)
+        self.socketConnectionKey = self.socketManager.start_kline_socket(self.symbol, self.handle_socket_message,
+                                                                         interval=self.interval)
+        self.socketManager.start()
+        self.output_message(f'Started kline websocket stream for {self.symbol} {self.interval} intervals.')
+
+    def stop_kline_socket(self):
+        """
+        Stops the websocket kline stream (if one is running).
+        """
+        if self.socketManager is not None:
+            self.socketManager.stop_socket(self.socketConnectionKey)
+            self.socketManager = None
+            self.socketConnectionKey = None
+            self.socketUpdated = False
+
+    def handle_socket_message(self, msg: dict):
+        """
+        Handles messages pushed by the kline websocket stream. Current values are updated in place and completed
+        candles are inserted into run-time data.
+        :param msg: Message dictionary from the websocket stream.
+        """
+        if msg.get('e') == 'error':
+            # The socket factory only reports an error once its reconnect retries are exhausted and does not
+            # retry afterwards, so REST polling is permanent from here on.
+            self.socketUpdated = False
+            self.try_callback("Websocket stream error detected. Falling back to polling.")
+            return
+
+        kline = msg['k']
+        currentDataDictionary = {'date_utc': datetime.fromtimestamp(int(kline['t']) / 1000, tz=timezone.utc),
+                                 'open': float(kline['o']),
+                                 'high': float(kline['h']),
+                                 'low': float(kline['l']),
+                                 'close': float(kline['c']),
+                                 'volume': float(kline['v']),
+                                 'quote_asset_volume': float(kline['q']),
+                                 'number_of_trades': float(kline['n']),
+                                 'taker_buy_base_asset': float(kline['V']),
+                                 'taker_buy_quote_asset': float(kline['Q']),
+                                 }
+
+        if kline['x']:  # Candle completed, so insert it into run-time data.
+            with self.dataLock:
+                if not self.data or self.data[0]['date_utc'] < currentDataDictionary['date_utc']:
+                    self.data.insert(0, currentDataDictionary)
+        self.current_values = currentDataDictionary
+        self.socketLastUpdate = time.monotonic()
+        self.socketUpdated = True
 
     def get_current_data(self, counter: int = 0) -> dict:
         """
-        Retrieves current market dictionary with open, high, low, close prices.
+        Retrieves current market dictionary with open, high, low, close prices. If a kline websocket stream is
+        pushing updates, the most recently pushed values are returned without any REST call.
         :param counter: Counter to check how many times bot is trying to retrieve current data.
         :return: A dictionary with current open, high, low, and close prices.
         """
+        if self.socketUpdated:  # Websocket stream is live, so current values have already been pushed in.
+            # Binance pushes kline updates roughly every two seconds; anything much older than that means the
+            # stream has silently stalled, so revert to REST polling rather than trade on a frozen price.
+            if time.monotonic() - self.socketLastUpdate < 10:
+                self.remove_past_data_if_needed()
+                return self.current_values
+
+            self.socketUpdated = False
+            self.try_callback("Websocket stream stalled. Falling back to polling.")
+
         try:
             self.remove_past_data_if_needed()
             if not self.data_is_updated():
@@ -106,18 +106,13 @@ class Statistics(QDialog):
 
     def modify_tab(self, valueDictionary, tabType):
         """
-        Modifies tab.
+        Modifies tab. The dictionary provided may be partial; categories and keys that are absent are left as is.
         :param valueDictionary: Dictionary with values.
         :param tabType: Tab type to be modified.
         """
         innerTabs = self.tabs[tabType]['innerTabs']  # live/widgets
         self.set_profit_or_loss_label(valueDictionary=valueDictionary, innerTabs=innerTabs)
 
-        for key in innerTabs:  # If there's a change in the value dictionary, re-initialize the tab.
-            if key not in valueDictionary:
-                self.initialize_tab(valueDictionary=valueDictionary, tabType=tabType)
-                break
-
         for categoryKey in valueDictionary:
             if categoryKey not in innerTabs:
                 tab = self.tabs[tabType]['tab']
@@ -10,6 +10,7 @@ class MovingAverageStrategy(Strategy):
     def __init__(self, parent=None, inputs: List[Option] = None, precision: int = 2):
         super().__init__(name='Moving Average', parent=parent, precision=precision)
         self.tradingOptions: List[Option] = inputs
+        self.optionParams: List[tuple] = []  # Cached per-option parameters and pretty names.
         self.dynamic = True
         self.description = "Basic trading strategy using moving averages. If the moving average of initial is greater" \
                            " than final, a bullish trend is determined. If the moving average of final is greater, a " \
@@ -18,6 +19,9 @@ class MovingAverageStrategy(Strategy):
 
         if parent:  # Only validate if parent exists. If no parent, this mean's we're just calling this for param types.
             self.validate_options()
+            # Options never change during a run, so resolve each option's parameters and pretty names once here
+            # instead of on every trend check.
+            self.optionParams = [option.get_all_params() + option.get_pretty_option() for option in self.tradingOptions]
 
     def get_min_option_period(self) -> int:
         """
@@ -50,39 +54,33 @@ class MovingAverageStrategy(Strategy):
         if not data:
             data = parent.dataView
 
+        optionDetails = []
         if type(data) == Data:
             if not data.data_is_updated():
                 data.update_data()
 
             if data == parent.dataView:
-                parent.optionDetails = []
+                parent.optionDetails = optionDetails
             else:
-                parent.lowerOptionDetails = []
-
-        for option in self.tradingOptions:
-            movingAverage, parameter, initialBound, finalBound = option.get_all_params()
-            initialName, finalName = option.get_pretty_option()
+                parent.lowerOptionDetails = optionDetails
 
+        for movingAverage, parameter, initialBound, finalBound, initialName, finalName in self.optionParams:
             if type(data) == list:
-                avg1 = parent.get_moving_average(data, option.movingAverage, option.initialBound, option.parameter)
-                avg2 = parent.get_moving_average(data, option.movingAverage, option.finalBound, option.parameter)
+                avg1 = parent.get_moving_average(data, movingAverage, initialBound, parameter)
+                avg2 = parent.get_moving_average(data, movingAverage, finalBound, parameter)
             else:
                 avg1 = parent.get_average(movingAverage, parameter, initialBound, data, update=False)
                 avg2 = parent.get_average(movingAverage, parameter, finalBound, data, update=False)
 
             if type(data) == Data:
-                if data == parent.dataView:
-                    if log_data:
+                if log_data:
+                    if data == parent.dataView:
                         parent.output_message(f'Regular interval ({data.interval}) data:')
-                    parent.optionDetails.append((avg1, avg2, initialName, finalName))
-                else:
-                    if log_data:
+                    else:
                         parent.output_message(f'Lower interval ({data.interval}) data:')
-                    parent.lowerOptionDetails.append((avg1, avg2, initialName, finalName))
-
-                if log_data:
-                    parent.output_message(f'{option.movingAverage}({option.initialBound}) = {avg1}')
-                    parent.output_message(f'{option.movingAverage}({option.finalBound}) = {avg2}')
+                    parent.output_message(f'{movingAverage}({initialBound}) = {avg1}')
+                    parent.output_message(f'{movingAverage}({finalBound}) = {avg2}')
+                optionDetails.append((avg1, avg2, initialName, finalName))
 
             if avg1 > avg2:
                 trends.append(BULLISH)
@@ -1,4 +1,6 @@
+import queue
 import random
+from threading import Thread
 
 from telegram import Bot, constants
 from telegram.ext import Updater, CommandHandler
@@ -16,6 +18,10 @@ class TelegramBot:
         self.updater = Updater(token, use_context=True)
         self.bot = Bot(token=self.token)
 
+        self.outbox = queue.Queue(maxsize=50)  # Outgoing messages consumed by the sender thread.
+        self.senderThread = Thread(target=self.process_outbox, daemon=True)
+        self.senderThread.start()
+
         # Get the dispatcher to register handlers
         dp = self.updater.dispatcher
 
@@ -41,11 +47,30 @@ class TelegramBot:
 
     def send_message(self, chatID, message):
         """
-        Sends provided message to specified chat ID using Telegram.
+        Queues provided message to be sent to specified chat ID using Telegram. Messages are delivered by a
+        dedicated sender thread, so callers such as the trading loop never block on Telegram's HTTP latency.
         :param chatID: Chat ID in Telegram to send message to.
         :param message: Message to send.
         """
-        self.bot.send_message(chat_id=chatID, text=message)
+        try:
+            self.outbox.put_nowait((chatID, message))
+        except queue.Full:  # Telegram is falling far behind; drop the message rather than block the caller.
+            pass
+
+    def process_outbox(self):
+        """
+        Continuously delivers queued messages to Telegram. This runs on a daemon thread until the bot is stopped.
+        """
+        while True:
+            item = self.outbox.get()
+            if item is None:  # Sentinel from stop() to shut the sender thread down.
+                break
+
+            chatID, message = item
+            try:
+                self.bot.send_message(chat_id=chatID, text=message)
+            except Exception:
+                continue  # Delivery is best effort; Telegram errors should never affect the trading loop.
 
     def start(self):
         """
@@ -59,6 +84,16 @@ class TelegramBot:
         """
         self.updater.stop()
 
+        try:
+            self.outbox.put_nowait(None)  # Tell the sender thread to exit once queued messages are handled.
+        except queue.Full:  # Outbox is backed up (likely unreachable Telegram); clear it so the sentinel fits.
+            try:
+                while True:
+                    self.outbox.get_nowait()
+            except queue.Empty:
+                pass
+            self.outbox.put_nowait(None)
+
     # noinspection PyUnusedLocal
     def get_trades_telegram(self, update, context):
         """
@@ -165,8 +200,8 @@ class TelegramBot:
 
         for option in self.botThread.optionDetails:  # previously trader.tradingOptions
             avg1, avg2, name1, name2 = option
-            optionString += f'{name1}: ${round(avg1, trader.precision)}\n'
-            optionString += f'{name2}: ${round(avg2, trader.precision)}\n'
+            optionString += f'{name1}: ${avg1:,.{trader.precision}f}\n'
+            optionString += f'{name2}: ${avg2:,.{trader.precision}f}\n'
 
         return (f'Symbol: {trader.symbol}\n'
                 f'Position: {trader.get_position_string()}\n'
@@ -174,12 +209,12 @@ class TelegramBot:
                 f'Total trades made: {len(trader.trades)}\n'
                 f"Coin owned: {trader.coin}\n"
                 f"Coin owed: {trader.coinOwed}\n"
-                f"Starting balance: ${round(trader.startingBalance, 2)}\n"
-                f"Balance: ${round(trader.balance, 2)}\n"
-                f'Net: ${round(trader.get_net(), 2)}\n'
-                f"{profitLabel}: ${round(abs(profit), 2)}\n"
-                f'{profitLabel} Percentage: {round(self.botThread.percentage, 2)}%\n'
-                f'Daily Percentage: {round(self.botThread.dailyPercentage, 2)}%\n'
+                f"Starting balance: ${trader.startingBalance:,.2f}\n"
+                f"Balance: ${trader.balance:,.2f}\n"
+                f'Net: ${trader.get_net():,.2f}\n'
+                f"{profitLabel}: ${abs(profit):,.2f}\n"
+                f'{profitLabel} Percentage: {self.botThread.percentage:.2f}%\n'
+                f'Daily Percentage: {self.botThread.dailyPercentage:.2f}%\n'
                 f'Autonomous Mode: {not trader.inHumanControl}\n'
                 f'Loss Strategy: {trader.get_stop_loss_strategy_string()}\n'
                 f'Stop Loss Percentage: {round(trader.lossPercentageDecimal * 100, 2)}%\n'
@@ -1,9 +1,11 @@
 import traceback
 import time
+import os
 import algobot.helpers as helpers
 
-from datetime import datetime, timedelta
-from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, pyqtSlot
+from threading import Event, Lock
+
+from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, pyqtSlot, QTimer, QEventLoop, QThreadPool
 
 from algobot.data import Data
 from algobot.enums import LIVE, SIMULATION, BEARISH, BULLISH
@@ -11,12 +13,40 @@ from algobot.traders.realtrader import RealTrader
 from algobot.traders.simulationtrader import SimulationTrader
 from algobot.telegramBot import TelegramBot
 
+# Maps an interval to the next lower interval used for lower interval trading.
+LOWER_INTERVAL = {
+    '3m': '1m',
+    '5m': '3m',
+    '15m': '5m',
+    '30m': '15m',
+    '1h': '30m',
+    '2h': '1h',
+    '4h': '2h',
+    '6h': '4h',
+    '8h': '6h',
+    '12h': '8h',
+    '1d': '12h',
+    '3d': '1d',
+}
+
+# Maps a scheduling unit to its amount of seconds.
+UNIT_SECONDS = {
+    'Seconds': 1,
+    'Minutes': 60,
+    'Hours': 3600,
+    'Days': 86400,
+}
+
+# Dedicated pool for bot threads sized to the core count, so repeatedly starting and stopping bots cannot grow
+# the pool without bound or starve the GUI's general worker pool.
+BOT_POOL = QThreadPool()
+BOT_POOL.setMaxThreadCount(max(2, os.cpu_count() or 1))  # cpu_count() may return None on some platforms.
+
 
 class BotSignals(QObject):
     smallError = pyqtSignal(str)  # Signal emitted when small errors such as internet losses occur.
     started = pyqtSignal(int)  # Signal emitted when bot first starts.
     activity = pyqtSignal(int, str)  # Signal emitted to broadcast current activity.
-    updated = pyqtSignal(int, dict, dict)  # Signal emitted when bot is updated.
     finished = pyqtSignal()  # Signal emitted when bot is ended.
     error = pyqtSignal(int, str)  # Signal emitted when a critical error occurs.
     restore = pyqtSignal()  # Signal emitted to restore GUI.
@@ -35,8 +65,11 @@ class BotSignals(QObject):
 
 
 class BotThread(QRunnable):
+    TREND_NAMES = {BEARISH: 'Bearish', BULLISH: 'Bullish', None: 'No'}  # Trend names for notification messages.
+
     def __init__(self, caller: int, gui, logger):
         super(BotThread, self).__init__()
+        self.setAutoDelete(True)  # Free the runnable promptly once its run finishes.
         self.signals = BotSignals()
         self.logger = logger
         self.gui = gui
@@ -52,14 +85,26 @@ class BotThread(QRunnable):
         self.previousDayNet = None  # Previous day net value to compare to.
 
         self.schedulePeriod = None  # Next schedule period in string format.
-        self.nextScheduledEvent = None  # These are for periodic scheduling. This variable holds next schedule event.
+        self.nextScheduledEvent = None  # Monotonic deadline for the next periodic scheduling event.
         self.scheduleSeconds = None  # Amount of seconds to schedule in.
 
         self.lowerIntervalNotification = False
+        self.telegramNotification = False  # Cached Telegram notification setting, refreshed when toggled.
         self.lowerTrend = 'None'
+        self.previousLowerTrend = None  # Previous lower interval trend used for notification logic.
+        self.timer = None  # Timer that will periodically schedule ticks.
+        self.eventLoop = None  # Event loop that will keep the thread alive between ticks.
         self.telegramChatID = gui.configuration.telegramChatID.text()
         self.caller = caller
+        self.runFlag = Event()  # Thread-safe flag that keeps the trading loop ticking until the GUI clears it.
         self.trader = None
+        self.lowerData = None  # Lower interval data object cached for the trading loop.
+        self.staticValueDict = {}  # Statistics that never change during a run, built once in setup_bot.
+        self.lastValueDict = {}  # Previously published statistics used to only publish changed values.
+        self.lastGroupedDict = {}  # Previously published grouped statistics used to only publish changed values.
+        self.statsLock = Lock()  # Protects the pending statistics dictionaries below.
+        self.pendingValueDict = {}  # Accumulated statistics changes not yet consumed by the GUI.
+        self.pendingGroupedDict = {}  # Accumulated grouped statistics changes not yet consumed by the GUI.
 
         self.failed = False  # All these variables pertain to bot failures.
         self.failCount = 0
@@ -73,12 +118,11 @@ class BotThread(QRunnable):
         :param caller: Caller that determines whether lower interval is for simulation or live bot.
         :param interval: Current interval for simulation or live bot.
         """
-        sortedIntervals = ('1m', '3m', '5m', '15m', '30m', '1h', '2h', '12h', '4h', '6h', '8h', '1d', '3d')
         gui = self.gui
         symbol = self.trader.symbol
+        lowerInterval = LOWER_INTERVAL.get(interval)
 
-        if interval != '1m':
-            lowerInterval = sortedIntervals[sortedIntervals.index(interval) - 1]
+        if lowerInterval is not None:
             intervalString = helpers.convert_small_interval(lowerInterval)
             self.lowerIntervalNotification = True
             self.signals.activity.emit(caller, f'Retrieving {symbol} data for {intervalString.lower()} intervals...')
@@ -153,6 +197,7 @@ class BotThread(QRunnable):
             raise RuntimeError("Download failed.")
 
         self.signals.activity.emit(caller, "Retrieved data successfully.")
+        self.trader.dataView.start_kline_socket()  # Push new candles instead of polling the REST API per tick.
 
         if configDict['lowerIntervalCheck'].isChecked():
             self.initialize_lower_interval_trading(caller=caller, interval=interval)
@@ -178,31 +223,26 @@ class BotThread(QRunnable):
         unit = gui.configuration.schedulingIntervalComboBox.currentText()
         self.schedulePeriod = f'{measurement} {unit.lower()}'
 
-        if unit == "Seconds":
-            seconds = measurement
-        elif unit == "Minutes":
-            seconds = measurement * 60
-        elif unit == "Hours":
-            seconds = measurement * 3600
-        elif unit == "Days":
-            seconds = measurement * 3600 * 24
-        else:
+        try:
+            seconds = measurement * UNIT_SECONDS[unit]
+        except KeyError:
             raise ValueError("Invalid type of unit.")
 
         message = f'Initiated periodic statistics notification every {self.schedulePeriod}.'
         self.gui.telegramBot.send_message(self.telegramChatID, message=message)
 
         self.scheduleSeconds = seconds
-        self.nextScheduledEvent = datetime.now() + timedelta(seconds=seconds)
+        self.nextScheduledEvent = time.monotonic() + seconds
 
     def handle_scheduler(self):
         """
         Handles lower data interval notification. If the current time is equal or later than the next scheduled event,
-        a message is sent via Telegram.
+        a message is sent via Telegram. Deadlines are plain monotonic floats, so checking them every tick is cheap.
         """
-        if self.nextScheduledEvent and datetime.now() >= self.nextScheduledEvent:
+        now = time.monotonic()
+        if self.nextScheduledEvent and now >= self.nextScheduledEvent:
             self.gui.telegramBot.send_statistics_telegram(self.telegramChatID, self.schedulePeriod)
-            self.nextScheduledEvent = datetime.now() + timedelta(seconds=self.scheduleSeconds)
+            self.nextScheduledEvent = now + self.scheduleSeconds
 
     def set_parameters(self, caller: int):
         """
@@ -212,7 +252,7 @@ class BotThread(QRunnable):
         lossDict = self.gui.get_loss_settings(caller)
         takeProfitDict = self.gui.configuration.get_take_profit_settings(caller)
 
-        trader: SimulationTrader = self.gui.get_trader(caller)
+        trader: SimulationTrader = self.trader
         trader.apply_take_profit_settings(takeProfitDict)
         trader.apply_loss_settings(lossDict)
         trader.setup_strategies(self.gui.configuration.get_strategies(caller))
@@ -225,6 +265,13 @@ class BotThread(QRunnable):
         """
         self.create_trader(caller)
         self.set_parameters(caller)
+        self.lowerData = self.gui.get_lower_interval_data(caller)  # Cached for the trading loop.
+        self.staticValueDict = {'tickerLabel': self.trader.symbol}
+
+        # Snapshot the notification setting so the trading loop reads a plain attribute instead of a Qt widget
+        # every tick. The toggled signal keeps the snapshot in sync if the user changes the setting mid-run.
+        self.telegramNotification = self.gui.configuration.enableTelegramNotification.isChecked()
+        self.gui.configuration.enableTelegramNotification.toggled.connect(self.refresh_telegram_notification)
 
         if caller == LIVE:
             if self.gui.configuration.enableTelegramTrading.isChecked():
@@ -237,43 +284,7 @@ class BotThread(QRunnable):
         else:
             raise RuntimeError("Invalid type of caller specified.")
 
-    def update_data(self, caller):
-        """
-        Updates data if updated data exists for caller object.
-        :param caller: Object type that will be updated.
-        """
-        trader = self.gui.get_trader(caller)
-        if not trader.dataView.data_is_updated():
-            trader.dataView.update_data()
-
-    def handle_trading(self, caller):
-        """
-        Handles trading by checking if automation mode is on or manual.
-        :param caller: Object for which function will handle trading.
-        """
-        trader = self.gui.get_trader(caller)
-        trader.main_logic(log_data=self.gui.advancedLogging)
-
-    def handle_current_and_trailing_prices(self, caller):
-        """
-        Handles trailing prices for caller object.
-        :param caller: Trailing prices for what caller to be handled for.
-        """
-        trader: SimulationTrader = self.gui.get_trader(caller)
-        trader.dataView.get_current_data()
-        trader.currentPrice = trader.dataView.current_values['close']
-        if trader.longTrailingPrice is not None and trader.currentPrice > trader.longTrailingPrice:
-            trader.longTrailingPrice = trader.currentPrice
-        if trader.shortTrailingPrice is not None and trader.currentPrice < trader.shortTrailingPrice:
-            trader.shortTrailingPrice = trader.currentPrice
-
-    def handle_logging(self, caller):
-        """
-        Handles logging type for caller object.
-        :param caller: Object those logging will be performed.
-        """
-        if self.gui.advancedLogging:
-            self.gui.get_trader(caller).output_basic_information()
+        self.runFlag.set()
 
     def initialize_telegram_bot(self):
         """
@@ -288,25 +299,33 @@ class BotThread(QRunnable):
         if self.gui.telegramBot and gui.configuration.chatPass:
             self.gui.telegramBot.send_message(self.telegramChatID, "Started Telegram bot.")
 
+    def refresh_telegram_notification(self, enabled: bool):
+        """
+        Refreshes the cached Telegram notification setting when the user toggles it mid-run.
+        :param enabled: New state of the Telegram notification setting.
+        """
+        self.telegramNotification = enabled
+
     def handle_lower_interval_cross(self, caller, previousLowerTrend) -> bool or None:
         """
         Handles logic and notifications for lower interval cross data.
         :param previousLowerTrend: Previous lower trend. Used to check if notification is necessary.
         :param caller: Caller for which we will check lower interval cross data.
         """
-        if self.lowerIntervalNotification:
-            trader: SimulationTrader = self.gui.get_trader(caller)
-            lowerData = self.gui.get_lower_interval_data(caller)
-            lowerData.get_current_data()
-            lowerTrend = trader.get_trend(dataObject=lowerData, log_data=self.gui.advancedLogging)
-            self.lowerTrend = trader.get_trend_string(lowerTrend)
-            if previousLowerTrend != lowerTrend:
-                trends = {BEARISH: 'Bearish', BULLISH: 'Bullish', None: 'No'}
-                message = f'{trends[lowerTrend]} trend detected on lower interval data.'
-                self.signals.activity.emit(caller, message)
-                if self.gui.configuration.enableTelegramNotification.isChecked() and caller == LIVE:
-                    self.gui.telegramBot.send_message(message=message, chatID=self.telegramChatID)
-            return lowerTrend
+        if not self.lowerIntervalNotification:  # Lower interval trading is not enabled, so nothing to check.
+            return None
+
+        trader: SimulationTrader = self.trader
+        lowerData = self.lowerData
+        lowerData.get_current_data()
+        lowerTrend = trader.get_trend(dataObject=lowerData, log_data=self.gui.advancedLogging)
+        self.lowerTrend = trader.get_trend_string(lowerTrend)
+        if previousLowerTrend != lowerTrend:
+            message = f'{self.TREND_NAMES[lowerTrend]} trend detected on lower interval data.'
+            self.signals.activity.emit(caller, message)
+            if self.telegramNotification and caller == LIVE:
+                self.gui.telegramBot.send_message(message=message, chatID=self.telegramChatID)
+        return lowerTrend
 
     def set_daily_percentages(self, trader, net):
         """
@@ -346,53 +365,127 @@ class BotThread(QRunnable):
         self.set_daily_percentages(trader=trader, net=net)
 
         groupedDict = trader.get_grouped_statistics()
-        groupedDict['general']['net'] = f'${round(net, 2)}'
-        groupedDict['general']['profit'] = f'${round(profit, 2)}'
+        groupedDict['general']['net'] = f'${net:,.2f}'
+        groupedDict['general']['profit'] = f'${profit:,.2f}'
         groupedDict['general']['elapsed'] = self.elapsed
-        groupedDict['general']['totalPercentage'] = f'{round(self.percentage, 2)}%'
-        groupedDict['general']['dailyPercentage'] = f'{round(self.dailyPercentage, 2)}%'
+        groupedDict['general']['totalPercentage'] = f'{self.percentage:.2f}%'
+        groupedDict['general']['dailyPercentage'] = f'{self.dailyPercentage:.2f}%'
 
         if trader.lowerOptionDetails:
             groupedDict['general']['lowerTrend'] = self.lowerTrend
 
-        valueDict = {
+        valueDict = dict(self.staticValueDict)
+        valueDict.update({
             'profitLossLabel': trader.get_profit_or_loss_string(profit=profit),
-            'profitLossValue': f'${abs(round(profit, 2))}',
-            'percentageValue': f'{round(self.percentage, 2)}%',
-            'netValue': f'${round(net, 2)}',
+            'profitLossValue': f'${abs(profit):,.2f}',
+            'percentageValue': f'{self.percentage:.2f}%',
+            'netValue': f'${net:,.2f}',
             'tickerValue': f'${trader.currentPrice}',
-            'tickerLabel': trader.symbol,
             'currentPositionValue': trader.get_position_string(),
             'net': net,
             'price': trader.currentPrice,
             'optionDetails': self.optionDetails,
-        }
+        })
+
+        return valueDict, groupedDict
 
+    def publish_statistics_if_changed(self, valueDict: dict, groupedDict: dict):
+        """
+        Publishes statistics for the GUI, but only the values that changed since the previous tick. Changes are
+        merged into pending dictionaries that the GUI polls at its own pace, so ticks faster than the GUI can
+        render coalesce into a single update instead of queueing a Qt event each.
+        :param valueDict: Full dictionary with main interface values.
+        :param groupedDict: Full dictionary with grouped statistics values.
+        """
+        lastValueDict = self.lastValueDict
+        lastGroupedDict = self.lastGroupedDict
+        valueDelta = {key: value for key, value in valueDict.items() if lastValueDict.get(key) != value}
+
+        groupedDelta = {}
+        for category, values in groupedDict.items():
+            lastValues = lastGroupedDict.get(category, {})
+            delta = {key: value for key, value in values.items() if lastValues.get(key) != value}
+            if delta:
+                groupedDelta[category] = delta
+
+        if valueDelta or groupedDelta:
+            with self.statsLock:
+                self.pendingValueDict.update(valueDelta)
+                for category, delta in groupedDelta.items():
+                    self.pendingGroupedDict.setdefault(category, {}).update(delta)
+            self.lastValueDict = valueDict
+            self.lastGroupedDict = groupedDict
+
+    def get_pending_statistics(self) -> tuple:
+        """
+        Returns accumulated statistics changes and clears the pending slot. Called from the GUI thread.
+        :return: A tuple with pending main interface values and pending grouped statistics values.
+        """
+        with self.statsLock:
+            valueDict, self.pendingValueDict = self.pendingValueDict, {}
+            groupedDict, self.pendingGroupedDict = self.pendingGroupedDict, {}
         return valueDict, groupedDict
 
-    def trading_loop(self, caller):
+    def get_poll_interval_milliseconds(self) -> int:
+        """
+        Returns the poll interval in milliseconds for the tick timer. The interval is capped at one second so the
+        bot stays responsive on longer candle intervals while still sleeping between ticks.
+        :return: Poll interval in milliseconds.
         """
-        Main loop that runs based on caller.
+        intervalSeconds = self.trader.dataView.get_interval_minutes() * 60
+        return min(intervalSeconds, 1) * 1000
+
+    def tick(self, caller):
+        """
+        Executes one iteration of the trading loop. This is invoked periodically by the tick timer.
         :param caller: Caller object that determines which bot is running.
         """
-        lowerTrend = None  # This variable is used for lower trend notification logic.
-        runningLoop = self.gui.runningLive if caller == LIVE else self.gui.simulationRunningLive
-        trader: SimulationTrader = self.gui.get_trader(caller=caller)
+        if not self.runFlag.is_set() or self.failCount >= self.failLimit:
+            self.stop_loop()
+            return
 
-        while runningLoop:
+        trader: SimulationTrader = self.trader
+        dataView = trader.dataView
+        advancedLogging = self.gui.advancedLogging
+        try:
             trader.completedLoop = False  # This boolean is checked when bot is ended to ensure it finishes its loop.
-            self.update_data(caller)  # Check for new updates.
-            self.handle_logging(caller=caller)  # Handle logging.
-            self.handle_current_and_trailing_prices(caller=caller)  # Handle trailing prices.
-            self.handle_trading(caller=caller)  # Main logic function.
+
+            if not dataView.data_is_updated():  # Check for new updates.
+                dataView.update_data()
+
+            if advancedLogging:  # Handle logging.
+                trader.output_basic_information()
+
+            dataView.get_current_data()  # Handle current and trailing prices.
+            price = dataView.current_values['close']
+            trader.currentPrice = price
+            if trader.longTrailingPrice is not None and price > trader.longTrailingPrice:
+                trader.longTrailingPrice = price
+            elif trader.shortTrailingPrice is not None and price < trader.shortTrailingPrice:
+                trader.shortTrailingPrice = price
+
+            trader.main_logic(log_data=advancedLogging)  # Main logic function.
             self.handle_scheduler()  # Handle periodic statistics scheduler.
-            lowerTrend = self.handle_lower_interval_cross(caller, lowerTrend)  # Check lower trend.
+            if self.lowerIntervalNotification:  # Only check lower trends when lower interval trading is enabled.
+                self.previousLowerTrend = self.handle_lower_interval_cross(caller, self.previousLowerTrend)
             valueDict, groupedDict = self.get_statistics()  # Basic statistics of bot to update GUI.
-            self.signals.updated.emit(caller, valueDict, groupedDict)
-            runningLoop = self.gui.runningLive if caller == LIVE else self.gui.simulationRunningLive
+            self.publish_statistics_if_changed(valueDict, groupedDict)
             self.failCount = 0  # Reset fail count as bot fixed itself.
+            self.failed = False
+        except Exception as e:
+            self.handle_exception(e, trader)
+        finally:
             trader.completedLoop = True  # Set completedLoop to True. Or else, there'll be an infinite loop in the GUI.
 
+    def stop_loop(self):
+        """
+        Stops the tick timer and quits the event loop so the thread can wrap up.
+        """
+        if self.timer:
+            self.timer.stop()
+        if self.eventLoop:
+            self.eventLoop.quit()
+
     def try_setting_up_bot(self) -> bool:
         """
         This function will try to setup the main bot for trading.
@@ -403,17 +496,15 @@ class BotThread(QRunnable):
             self.signals.started.emit(self.caller)
             return True
         except Exception as e:
-            error_message = traceback.format_exc()
             trader: SimulationTrader = self.gui.get_trader(self.caller)
-
-            self.logger.critical(error_message)
+            self.logger.exception('Bot setup failed.')
 
             if trader:
                 trader.output_message(f'Bot has crashed because of :{e}', printMessage=True)
-                trader.output_message(error_message, printMessage=False)
+                trader.output_message(traceback.format_exc(), printMessage=False)
             if self.gui.telegramBot and self.gui.configuration.chatPass:
                 self.gui.telegramBot.send_message(self.telegramChatID, f"Bot has crashed because of :{e}.")
-                self.gui.telegramBot.send_message(self.telegramChatID, error_message)
+                self.gui.telegramBot.send_message(self.telegramChatID, traceback.format_exc())
 
             self.failError = str(e)
             return False
@@ -427,15 +518,14 @@ class BotThread(QRunnable):
         self.failed = True  # Boolean that'll let the bot know it failed.
         self.failCount += 1  # Increment failCount by 1. There's a default limit of 10 fails.
         self.failError = str(e)  # This is the fail error that led to the crash.
-        error_message = traceback.format_exc()  # Get error message.
 
         attemptsLeft = self.failLimit - self.failCount
         s = self.failSleep
         self.signals.activity.emit(self.caller, f'{e} {attemptsLeft} attempts left. Retrying in {s} seconds.')
-        self.logger.critical(error_message)
+        self.logger.exception('Bot failed to complete its tick.')
 
         if trader:  # Log this message to the trader's log.
-            trader.output_message(error_message, printMessage=True)
+            trader.output_message(traceback.format_exc(), printMessage=True)
             trader.output_message(f'Bot has crashed because of :{e}', printMessage=True)
             trader.output_message(f"({self.failCount})Trying again in {self.failSleep} seconds.", printMessage=True)
 
@@ -443,33 +533,30 @@ class BotThread(QRunnable):
             if self.gui.telegramBot and self.gui.configuration.chatPass:  # Send crash information through Telegram.
                 self.gui.telegramBot.send_message(self.telegramChatID, f"Bot has crashed because of :{e}.")
                 if self.failCount == self.failLimit:
-                    self.gui.telegramBot.send_message(self.telegramChatID, error_message)
+                    self.gui.telegramBot.send_message(self.telegramChatID, traceback.format_exc())
                     self.gui.telegramBot.send_message(self.telegramChatID, "Bot has died.")
                 else:
                     failCount = self.failCount
                     self.gui.telegramBot.send_message(self.telegramChatID, f"({failCount})Trying again in {s} seconds.")
-        except Exception as e:
-            self.logger.critical(str(e))
+        except Exception:
+            self.logger.exception('Failed to send crash information via Telegram.')
 
         time.sleep(self.failSleep)  # Sleep for some seconds before reattempting a fix.
         trader.retrieve_margin_values()  # Update bot margin values.
         trader.check_current_position()  # Check position it's in.
 
-    def run_loop(self, trader):
+    def run_loop(self):
         """
-        Main function that'll handle exceptions and keep the loop running.
-        :param trader: Trader trading in the current loop.
+        Main function that'll run the trading loop on an event loop until the bot is ended. A timer schedules ticks
+        at the poll interval, so the thread sleeps between updates instead of spinning.
         """
-        while self.failCount < self.failLimit:
-            runningLoop = self.gui.runningLive if self.caller == LIVE else self.gui.simulationRunningLive
-            if not runningLoop:
-                return
-            try:
-                self.trading_loop(self.caller)
-                self.failed = False
-                return
-            except Exception as e:
-                self.handle_exception(e, trader)
+        self.eventLoop = QEventLoop()
+        self.timer = QTimer()
+        self.timer.setInterval(self.get_poll_interval_milliseconds())
+        self.timer.timeout.connect(lambda: self.tick(self.caller))
+        self.timer.start()
+        self.tick(self.caller)  # Run the first tick immediately instead of waiting a full poll interval.
+        self.eventLoop.exec_()
 
     @pyqtSlot()
     def run(self):
@@ -479,7 +566,12 @@ class BotThread(QRunnable):
         success = self.try_setting_up_bot()
         trader: SimulationTrader = self.gui.get_trader(self.caller)
         if success:
-            self.run_loop(trader)
+            self.run_loop()
+
+        try:
+            self.gui.configuration.enableTelegramNotification.toggled.disconnect(self.refresh_telegram_notification)
+        except TypeError:  # Setup crashed before the connection was made.
+            pass
 
         if trader:
             trader.completedLoop = True  # If false, this will cause an infinite loop.
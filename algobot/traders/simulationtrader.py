@@ -92,8 +92,8 @@ class SimulationTrader(Trader):
     def get_grouped_statistics(self) -> dict:
         groupedDict = {
             'general': {
-                'currentBalance': f'${round(self.balance, 2)}',
-                'startingBalance': f'${round(self.startingBalance, 2)}',
+                'currentBalance': f'${self.balance:,.2f}',
+                'startingBalance': f'${self.startingBalance:,.2f}',
                 'tradesMade': str(len(self.trades)),
                 'coinOwned': f'{round(self.coin, 6)}',
                 'coinOwed': f'{round(self.coinOwed, 6)}',
@@ -139,10 +139,10 @@ class SimulationTrader(Trader):
         if self.dataView.current_values:
             groupedDict['currentData'] = {
                 'UTC Open Time': self.dataView.current_values['date_utc'].strftime('%Y-%m-%d %H:%M:%S'),
-                'open': '$' + str(round(self.dataView.current_values['open'], self.precision)),
-                'close': '$' + str(round(self.dataView.current_values['close'], self.precision)),
-                'high': '$' + str(round(self.dataView.current_values['high'], self.precision)),
-                'low': '$' + str(round(self.dataView.current_values['low'], self.precision)),
+                'open': f"${self.dataView.current_values['open']:,.{self.precision}f}",
+                'close': f"${self.dataView.current_values['close']:,.{self.precision}f}",
+                'high': f"${self.dataView.current_values['high']:,.{self.precision}f}",
+                'low': f"${self.dataView.current_values['low']:,.{self.precision}f}",
                 'volume': str(round(self.dataView.current_values['volume'], self.precision)),
                 'quoteAssetVolume': str(round(self.dataView.current_values['quote_asset_volume'], self.precision)),
                 'numberOfTrades': str(round(self.dataView.current_values['number_of_trades'], self.precision)),
@@ -160,14 +160,14 @@ class SimulationTrader(Trader):
 
             for optionDetail in self.optionDetails:
                 initialAverage, finalAverage, initialAverageLabel, finalAverageLabel = optionDetail
-                groupedDict['movingAverages'][initialAverageLabel] = f'${round(initialAverage, precise)}'
-                groupedDict['movingAverages'][finalAverageLabel] = f'${round(finalAverage, precise)}'
+                groupedDict['movingAverages'][initialAverageLabel] = f'${initialAverage:,.{precise}f}'
+                groupedDict['movingAverages'][finalAverageLabel] = f'${finalAverage:,.{precise}f}'
 
             if self.lowerOptionDetails:
                 for optionDetail in self.lowerOptionDetails:
                     initialAverage, finalAverage, initialAverageLabel, finalAverageLabel = optionDetail
-                    groupedDict['movingAverages'][f'Lower {initialAverageLabel}'] = f'${round(initialAverage, precise)}'
-                    groupedDict['movingAverages'][f'Lower {finalAverageLabel}'] = f'${round(finalAverage, precise)}'
+                    groupedDict['movingAverages'][f'Lower {initialAverageLabel}'] = f'${initialAverage:,.{precise}f}'
+                    groupedDict['movingAverages'][f'Lower {finalAverageLabel}'] = f'${finalAverage:,.{precise}f}'
 
         self.add_strategy_info_to_grouped_dict(groupedDict)
         return groupedDict
@@ -0,0 +1,80 @@
+import unittest
+
+from algobot.threads.botThread import BotThread
+from algobot.enums import SIMULATION
+
+
+class StubLineEdit:
+    @staticmethod
+    def text() -> str:
+        return ''
+
+
+class StubConfiguration:
+    telegramChatID = StubLineEdit()
+
+
+class StubGui:
+    configuration = StubConfiguration()
+
+
+class TestBotThreadStatistics(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Sets up a bot thread object with a stub GUI.
+        """
+        self.botThread = BotThread(caller=SIMULATION, gui=StubGui(), logger=None)
+
+    def test_first_publish_delivers_full_dictionaries(self):
+        """
+        Test that the first publish delivers all values since nothing was published before.
+        """
+        valueDict = {'netValue': '$1,000.00', 'price': 5}
+        groupedDict = {'general': {'net': '$1,000.00', 'elapsed': '1 second'}}
+        self.botThread.publish_statistics_if_changed(valueDict, groupedDict)
+
+        pendingValueDict, pendingGroupedDict = self.botThread.get_pending_statistics()
+        self.assertEqual(pendingValueDict, valueDict)
+        self.assertEqual(pendingGroupedDict, groupedDict)
+
+    def test_unchanged_publish_delivers_nothing(self):
+        """
+        Test that publishing identical statistics again leaves nothing pending.
+        """
+        valueDict = {'netValue': '$1,000.00'}
+        groupedDict = {'general': {'net': '$1,000.00'}}
+        self.botThread.publish_statistics_if_changed(valueDict, groupedDict)
+        self.botThread.get_pending_statistics()
+
+        self.botThread.publish_statistics_if_changed(dict(valueDict), {'general': dict(groupedDict['general'])})
+        pendingValueDict, pendingGroupedDict = self.botThread.get_pending_statistics()
+        self.assertEqual(pendingValueDict, {})
+        self.assertEqual(pendingGroupedDict, {})
+
+    def test_publishes_coalesce_between_drains(self):
+        """
+        Test that multiple publishes between drains coalesce per key with the latest values winning.
+        """
+        self.botThread.publish_statistics_if_changed({'netValue': '$1,000.00', 'price': 5},
+                                                     {'general': {'net': '$1,000.00'}})
+        self.botThread.publish_statistics_if_changed({'netValue': '$1,200.00', 'price': 5},
+                                                     {'general': {'net': '$1,200.00', 'profit': '$200.00'}})
+
+        pendingValueDict, pendingGroupedDict = self.botThread.get_pending_statistics()
+        self.assertEqual(pendingValueDict, {'netValue': '$1,200.00', 'price': 5})
+        self.assertEqual(pendingGroupedDict, {'general': {'net': '$1,200.00', 'profit': '$200.00'}})
+
+    def test_drain_clears_pending_statistics(self):
+        """
+        Test that draining clears the pending slot so a second drain returns empty dictionaries.
+        """
+        self.botThread.publish_statistics_if_changed({'netValue': '$1,000.00'}, {'general': {'net': '$1,000.00'}})
+        self.botThread.get_pending_statistics()
+
+        pendingValueDict, pendingGroupedDict = self.botThread.get_pending_statistics()
+        self.assertEqual(pendingValueDict, {})
+        self.assertEqual(pendingGroupedDict, {})
+
+
+if __name__ == '__main__':
+    unittest.main()